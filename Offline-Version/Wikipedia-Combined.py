@@ -0,0 +1,103 @@
+import argparse
+import importlib.util
+import os
+import threading
+
+import wiki_stream
+
+# --- Konfiguration ---
+# Stream-Reader und Visualizer laufen in einem Prozess: Edits gehen als EditEvent direkt
+# an den Visualizer, OSC wird nur noch für SuperCollider und entfernte Empfänger gesendet.
+OSC_IP = "127.0.0.1"
+OSC_PORT_SC = 57120
+OSC_ADDRESS = "/wiki/edit_full"
+
+VISUALIZER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Wikipedia-Visualizer_v2.py")
+
+
+def load_visualizer():
+    # Der Dateiname enthält Bindestriche, daher Import über importlib.
+    # pygame wird erst hier geladen, ein Headless-Lauf bleibt davon unberührt.
+    spec = importlib.util.spec_from_file_location("wikipedia_visualizer_v2", VISUALIZER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_osc_clients(targets):
+    # pythonosc nur laden, wenn es tatsächlich OSC-Empfänger gibt
+    if not targets:
+        return []
+
+    from pythonosc.udp_client import SimpleUDPClient
+    return [SimpleUDPClient(ip, port) for ip, port in targets]
+
+
+def parse_target(text):
+    host, port = text.rsplit(":", 1)
+    return host, int(port)
+
+
+def print_edit(event):
+    print(f"Edit -> {event.wiki}: {event.title} ({event.delta})", flush=True)
+
+
+def run_stream(sinks, osc_clients, stop_event):
+    for data in wiki_stream.iter_recent_changes(stop_event=stop_event):
+        # Fehlerhafte Pakete oder Sendefehler (z.B. Netz weg) dürfen den Stream nicht beenden
+        try:
+            event = wiki_stream.to_edit_event(data)
+            if event is None:
+                continue
+
+            # In-Process: derselbe EditEvent geht ohne Serialisierung an alle Sinks
+            for sink in sinks:
+                sink(event)
+
+            if osc_clients:
+                osc_data = list(event)
+                for client in osc_clients:
+                    client.send_message(OSC_ADDRESS, osc_data)
+
+        except Exception as e:
+            print(f"Fehler bei Event: {e}", flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sonic Wikipedia: Stream-Reader und Visualizer in einem Prozess.")
+    parser.add_argument("--headless", action="store_true",
+                        help="Ohne Visualizer starten (nur Stream und OSC-Ausgabe)")
+    parser.add_argument("--no-sc", action="store_true",
+                        help="Keine Edits per OSC an SuperCollider senden")
+    parser.add_argument("--remote", action="append", default=[], metavar="HOST:PORT",
+                        help="Zusätzlicher OSC-Empfänger für /wiki/edit_full (mehrfach möglich)")
+    parser.add_argument("--sync-port", type=int, default=57121, metavar="PORT",
+                        help="UDP-Port des Visualizers für /wiki/control/sync und Presets (0 = aus)")
+    args = parser.parse_args()
+
+    targets = [] if args.no_sc else [(OSC_IP, OSC_PORT_SC)]
+    targets += [parse_target(t) for t in args.remote]
+    osc_clients = make_osc_clients(targets)
+
+    stop_event = threading.Event()
+
+    if args.headless:
+        try:
+            run_stream([print_edit], osc_clients, stop_event)
+        except KeyboardInterrupt:
+            print("\nStop.")
+        return
+
+    viz = load_visualizer()
+
+    reader_thread = threading.Thread(target=run_stream, args=([viz.ingest_edit], osc_clients, stop_event))
+    reader_thread.daemon = True
+    reader_thread.start()
+
+    try:
+        viz.main(listen=False, port=args.sync_port or None)
+    finally:
+        stop_event.set()
+
+if __name__ == "__main__":
+    main()
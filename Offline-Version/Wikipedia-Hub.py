@@ -0,0 +1,144 @@
+import asyncio
+import json
+import mimetypes
+import os
+import threading
+from http import HTTPStatus
+
+from websockets.asyncio.server import serve
+from websockets.datastructures import Headers
+from websockets.exceptions import ConnectionClosed
+from websockets.http11 import Response
+
+import wiki_stream
+
+# --- Konfiguration ---
+HUB_IP = "0.0.0.0"
+HUB_PORT = 8765
+WS_PATH = "/stream"
+
+# Batching: alle 50ms wird ein Frame mit allen neuen Edits verschickt
+BATCH_INTERVAL = 0.05
+MAX_BATCH = 500
+
+# So viele Frames dürfen pro Client ausstehen, danach werden die ältesten verworfen
+CLIENT_QUEUE_FRAMES = 8
+
+# Optional: Web-Version direkt vom Hub ausliefern (http://<host>:8765/?hub)
+SERVE_STATIC = True
+WEB_ROOT = os.path.realpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Web-Version"))
+
+
+class Hub:
+    """Verteilt die Edits einer einzigen Upstream-Verbindung an alle WebSocket-Clients."""
+
+    def __init__(self):
+        self.clients = set()
+        self.pending = []
+        self.dropped = 0         # verworfene Frames (langsame Clients)
+        self.dropped_records = 0 # verworfene Edits (mehr als MAX_BATCH pro Intervall)
+
+    def publish(self, record):
+        # Läuft im Event-Loop-Thread (via call_soon_threadsafe)
+        if len(self.pending) < MAX_BATCH:
+            self.pending.append(record)
+        else:
+            self.dropped_records += 1
+
+    async def batch_loop(self):
+        while True:
+            await asyncio.sleep(BATCH_INTERVAL)
+            if not self.pending:
+                continue
+
+            batch, self.pending = self.pending, []
+            if not self.clients:
+                continue
+
+            # Ein Frame wird nur einmal serialisiert und an alle Clients verteilt
+            frame = json.dumps(batch, ensure_ascii=False, separators=(",", ":"))
+            for queue in self.clients:
+                if queue.full():
+                    # Langsamer Client: ältesten Frame verwerfen, damit er live bleibt
+                    queue.get_nowait()
+                    self.dropped += 1
+                queue.put_nowait(frame)
+
+    async def handler(self, websocket):
+        queue = asyncio.Queue(maxsize=CLIENT_QUEUE_FRAMES)
+        self.clients.add(queue)
+        print(f"Client verbunden ({len(self.clients)} aktiv)", flush=True)
+        try:
+            while True:
+                frame = await queue.get()
+                await websocket.send(frame)
+        except ConnectionClosed:
+            pass
+        finally:
+            self.clients.discard(queue)
+            print(f"Client getrennt ({len(self.clients)} aktiv, {self.dropped} Frames und {self.dropped_records} Edits verworfen)", flush=True)
+
+
+def process_request(connection, request):
+    path = request.path.split("?", 1)[0]
+    if path == WS_PATH:
+        return None # WebSocket-Handshake normal fortsetzen
+
+    if not SERVE_STATIC:
+        return connection.respond(HTTPStatus.NOT_FOUND, "Not Found\n")
+
+    if path == "/":
+        path = "/Index.html"
+
+    file_path = os.path.realpath(os.path.join(WEB_ROOT, path.lstrip("/")))
+    name = os.path.basename(file_path)
+    if not file_path.startswith(WEB_ROOT + os.sep) or name.startswith(".") or not os.path.isfile(file_path):
+        return connection.respond(HTTPStatus.NOT_FOUND, "Not Found\n")
+
+    with open(file_path, "rb") as f:
+        body = f.read()
+
+    content_type = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
+    headers = Headers([
+        ("Content-Type", content_type),
+        ("Content-Length", str(len(body))),
+        ("Connection", "close"),
+    ])
+    return Response(HTTPStatus.OK.value, HTTPStatus.OK.phrase, headers, body)
+
+
+def upstream_reader(loop, hub, stop_event):
+    # Läuft in einem eigenen Thread, da requests blockierend liest
+    for data in wiki_stream.iter_recent_changes(chunk_size=4096, stop_event=stop_event):
+        try:
+            record = wiki_stream.compact_edit(data)
+            if record is not None:
+                loop.call_soon_threadsafe(hub.publish, record)
+        except Exception as e:
+            print(f"Fehlerhaftes Event ignoriert: {e}", flush=True)
+
+
+async def main():
+    hub = Hub()
+    stop_event = threading.Event()
+
+    reader_thread = threading.Thread(target=upstream_reader, args=(asyncio.get_running_loop(), hub, stop_event))
+    reader_thread.daemon = True
+    reader_thread.start()
+
+    # compression="deflate" aktiviert permessage-deflate für alle Clients
+    async with serve(hub.handler, HUB_IP, HUB_PORT,
+                     process_request=process_request, compression="deflate"):
+        print(f"Hub läuft. WebSocket auf ws://{HUB_IP}:{HUB_PORT}{WS_PATH}", flush=True)
+        if SERVE_STATIC:
+            print(f"Web-Version unter http://127.0.0.1:{HUB_PORT}/?hub", flush=True)
+        try:
+            await hub.batch_loop()
+        finally:
+            stop_event.set()
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("\nStop.")
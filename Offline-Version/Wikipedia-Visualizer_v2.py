@@ -3,8 +3,8 @@ import threading
 import time
 import math
 import random
-from pythonosc import dispatcher, osc_server
-from pythonosc.udp_client import SimpleUDPClient # Zum Senden an SuperCollider
+from param_sync import ParamSync, SYNC_ADDRESS, PRESET_ADDRESS
+from wiki_stream import EditEvent
 
 # --- Konfiguration ---
 WIDTH, HEIGHT = 1280, 720
@@ -32,7 +32,6 @@ OSC_ADDRESS = "/wiki/edit_full"
 
 # Client (Senden an SuperCollider)
 OSC_PORT_SEND = 57120
-sc_client = SimpleUDPClient("127.0.0.1", OSC_PORT_SEND)
 
 # Globale Listen und Stats
 particles = []
@@ -47,6 +46,21 @@ params = {
     "reverb": 0.4    # 0.0 bis 0.9
 }
 
+# Presets (Tasten 1-3 morphen, Shift + Taste speichert den aktuellen Stand)
+PRESETS = {
+    "default": {"balance": 0.0, "harmony": 0.5, "timbre": 0.5, "reverb": 0.4},
+    "ambient": {"balance": -0.8, "harmony": 1.0, "timbre": 0.3, "reverb": 0.8},
+    "digital": {"balance": 0.8, "harmony": 0.0, "timbre": 0.9, "reverb": 0.1}
+}
+PRESET_KEYS = ["default", "ambient", "digital"]
+MORPH_TIME = 3.0 # Sekunden
+
+# Parameter-Sync: sendet mit fester Kontrollrate an SuperCollider und alle, die sich per /wiki/control/sync melden
+param_sync = ParamSync(params)
+param_sync.subscribe("127.0.0.1", OSC_PORT_SEND)
+for name, values in PRESETS.items():
+    param_sync.presets[name] = dict(values)
+
 # --- UI KLASSEN ---
 class Slider:
     def __init__(self, x, y, w, h, label, explanation, param_key, min_val, max_val):
@@ -111,11 +125,9 @@ class Slider:
         norm = (x - self.rect.x) / self.rect.width
         new_val = self.min_val + (norm * (self.max_val - self.min_val))
         
-        # Update global params & send OSC
+        # Update global params; gesendet wird gebündelt im nächsten Control-Tick
         if params[self.param_key] != new_val:
-            params[self.param_key] = new_val
-            # Sende OSC an SuperCollider
-            sc_client.send_message("/wiki/control", [self.param_key, new_val])
+            param_sync.set(self.param_key, new_val)
 
 # --- 3D PARTIKEL KLASSE ---
 class Particle3D:
@@ -186,17 +198,25 @@ class Particle3D:
 
 
 def wiki_edit_handler(address, *args):
-    global stats
     try:
         if len(args) >= 6:
-            delta, is_bot, title_len, wiki_hash, title, wiki = args
+            event = EditEvent(*args[:6])
         else:
-            delta, is_bot, title_len, wiki_hash = args[:4]
-            title = "Unknown"
-            wiki = "-"
+            event = EditEvent(*args[:4], "Unknown", "-")
+    except Exception as e:
+        print(f"Error in Handler: {e}")
+        return
+
+    ingest_edit(event)
+
+def ingest_edit(event):
+    # Gemeinsamer Eingang: OSC-Handler und Combined-Launcher (ohne UDP) übergeben hier einen EditEvent
+    global stats
+    try:
+        delta, is_bot, wiki_hash = event.delta, event.is_bot, event.wiki_hash
 
         stats["count"] += 1
-        stats["last_wiki"] = wiki
+        stats["last_wiki"] = event.wiki
         
         x_norm = ((wiki_hash % 100) / 50.0) - 1.0 
         
@@ -207,7 +227,7 @@ def wiki_edit_handler(address, *args):
         size = max(2, int(y_log * 1.5))
         color = COLOR_BOT if is_bot > 0.5 else (COLOR_HUMAN_DEL if delta < 0 else COLOR_HUMAN_ADD)
 
-        new_p = Particle3D(x_norm, y_pos, color, size, is_bot > 0.5, title)
+        new_p = Particle3D(x_norm, y_pos, color, size, is_bot > 0.5, event.title)
         
         with lock:
             particles.append(new_p)
@@ -280,7 +300,9 @@ def draw_ui(surface, font_ui, font_small, font_title, sliders, hovered_particle)
         surface.blit(label, (box_x + 10, box_y + 5))
 
 
-def main():
+def main(listen=True, port=OSC_PORT_LISTEN):
+    # listen=False: Edits kommen direkt über ingest_edit (Combined-Launcher).
+    # port: OSC-Port für Edits und Parameter-Sync; None deaktiviert den Server (nur mit listen=False).
     pygame.init()
     pygame.font.init()
     
@@ -314,27 +336,48 @@ def main():
                           "Audio: Hall/Reverb|Visual: Schweif-Länge", 
                           "reverb", 0.0, 0.9))
 
-    for s in sliders:
-        sc_client.send_message("/wiki/control", [s.param_key, params[s.param_key]])
-
-    disp = dispatcher.Dispatcher()
-    disp.map(OSC_ADDRESS, wiki_edit_handler)
-    server = osc_server.ThreadingOSCUDPServer((OSC_IP, OSC_PORT_LISTEN), disp)
-    
-    server_thread = threading.Thread(target=server.serve_forever)
-    server_thread.daemon = True
-    server_thread.start()
+    # Der OSC-Server bedient den Parameter-Sync, Edits empfängt er nur mit listen=True
+    server = None
+    if port is not None:
+        from pythonosc import dispatcher, osc_server
+
+        disp = dispatcher.Dispatcher()
+        if listen:
+            disp.map(OSC_ADDRESS, wiki_edit_handler)
+        disp.map(SYNC_ADDRESS, param_sync.handle_sync, needs_reply_address=True)
+        disp.map(PRESET_ADDRESS, param_sync.handle_preset, needs_reply_address=True)
+        server = osc_server.ThreadingOSCUDPServer((OSC_IP, port), disp)
+        
+        server_thread = threading.Thread(target=server.serve_forever)
+        server_thread.daemon = True
+        server_thread.start()
     
-    print(f"Visualizer läuft. Empfange auf {OSC_PORT_LISTEN}, Sende an {OSC_PORT_SEND}...")
+    if listen:
+        print(f"Visualizer läuft. Empfange auf {port}, Sende an {OSC_PORT_SEND}...")
+    elif server:
+        print(f"Visualizer läuft (In-Process). Sync auf {port}, Sende an {OSC_PORT_SEND}...")
+    else:
+        print(f"Visualizer läuft (In-Process, ohne Sync). Sende an {OSC_PORT_SEND}...")
+
+    # Simulationsuhr: treibt Parameter-Sync und Morphs unabhängig von einzelnen Events
+    sim_time = 0.0
 
     running = True
     while running:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
+            elif event.type == pygame.KEYDOWN and pygame.K_1 <= event.key < pygame.K_1 + len(PRESET_KEYS):
+                name = PRESET_KEYS[event.key - pygame.K_1]
+                if event.mod & pygame.KMOD_SHIFT:
+                    param_sync.save_preset(name)
+                else:
+                    param_sync.morph_to(name, MORPH_TIME)
             for slider in sliders:
                 slider.handle_event(event)
 
+        param_sync.tick(sim_time)
+
         screen.fill((0, 0, 0))
         draw_grid(screen, params["harmony"])
         
@@ -356,9 +399,10 @@ def main():
         draw_ui(screen, font_ui, font_small, font_title, sliders, hovered_p)
 
         pygame.display.flip()
-        clock.tick(FPS)
+        sim_time += clock.tick(FPS) / 1000.0
 
-    server.shutdown()
+    if server:
+        server.shutdown()
     pygame.quit()
 
 if __name__ == "__main__":
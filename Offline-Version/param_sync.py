@@ -0,0 +1,147 @@
+import threading
+import time
+from pythonosc.udp_client import SimpleUDPClient
+
+# --- Konfiguration ---
+CONTROL_RATE = 30      # Hz, feste Senderate für Parameter-Updates
+SMOOTHING = 0.35       # Anteil, um den sich der gesendete Wert pro Tick dem Ziel nähert
+EPSILON = 1e-4         # Ab dieser Differenz wird direkt auf den Zielwert gesprungen
+
+CONTROL_ADDRESS = "/wiki/control"        # [key, value, epoch, version] (kompatibel zu Synth_v2)
+STATE_ADDRESS = "/wiki/control/state"    # [epoch, version, key1, value1, key2, value2, ...]
+SYNC_ADDRESS = "/wiki/control/sync"      # [optional: Port für laufende Updates]
+PRESET_ADDRESS = "/wiki/control/preset"  # [name, optional: Dauer in s]
+
+
+class ParamSync:
+    """Parameter-State-Service rund um den params-Dict.
+
+    params enthält die Zielwerte (UI, Presets). tick() läuft auf der Simulationsuhr,
+    glättet die Werte und sendet pro Tick nur die geänderten Keys an alle Abonnenten.
+    Jeder gesendete Stand erhöht die Versionsnummer. Die Epoche (Startzeit) unterscheidet
+    Neustarts, Versionen sind nur innerhalb derselben Epoche vergleichbar.
+    """
+
+    def __init__(self, params, rate=CONTROL_RATE, smoothing=SMOOTHING):
+        self.params = params
+        self.output = dict(params)
+        self.epoch = int(time.time())
+        self.version = 0
+        self.interval = 1.0 / rate
+        self.smoothing = smoothing
+        self.subscribers = {}
+        self.presets = {}
+        self.morph = None
+        self.next_tick = None
+        self.force = True # Beim ersten Tick den kompletten Stand senden
+        self.lock = threading.Lock()
+
+    # --- Abonnenten ---
+    def subscribe(self, ip, port):
+        with self.lock:
+            client = self.subscribers.get((ip, port))
+            if client is None:
+                client = SimpleUDPClient(ip, port)
+                self.subscribers[(ip, port)] = client
+        return client
+
+    def snapshot(self):
+        with self.lock:
+            state = [self.epoch, self.version]
+            for key, value in self.output.items():
+                state += [key, float(value)]
+        return state
+
+    # --- Parameter & Presets ---
+    def set(self, key, value):
+        # Zielwert setzen, gesendet wird erst beim nächsten Tick (Coalescing)
+        self.params[key] = value
+        with self.lock:
+            if self.morph:
+                self.morph["to"].pop(key, None) # Manuelle Eingabe gewinnt gegen den Morph
+
+    def save_preset(self, name):
+        self.presets[name] = dict(self.params)
+
+    def morph_to(self, name, duration):
+        if name not in self.presets:
+            print(f"Unbekanntes Preset: {name}")
+            return
+        with self.lock:
+            # Startzeit und Startwerte werden beim nächsten Tick auf der Simulationsuhr gesetzt
+            self.morph = {"start": None, "duration": duration, "from": None, "to": dict(self.presets[name])}
+
+    def _advance_morph(self, now):
+        with self.lock:
+            morph = self.morph
+            if morph is None:
+                return
+            if morph["start"] is None:
+                morph["start"] = now
+                morph["from"] = dict(self.params)
+
+            t = 1.0 if morph["duration"] <= 0 else min((now - morph["start"]) / morph["duration"], 1.0)
+            t = t * t * (3 - 2 * t) # Smoothstep
+
+            for key, target in morph["to"].items():
+                start = morph["from"].get(key, target)
+                self.params[key] = start + (target - start) * t
+
+            if t >= 1.0:
+                self.morph = None
+
+    # --- Kontrollrate ---
+    def tick(self, now):
+        """Einmal pro Frame mit der Simulationszeit (in Sekunden) aufrufen."""
+        if self.next_tick is not None and now < self.next_tick:
+            return
+        # Feste Rate ohne Drift; nach längeren Pausen nicht nachholen
+        if self.next_tick is None or now - self.next_tick > self.interval:
+            self.next_tick = now + self.interval
+        else:
+            self.next_tick += self.interval
+
+        self._advance_morph(now)
+
+        with self.lock:
+            changed = []
+            for key, target in self.params.items():
+                current = self.output.get(key, target)
+                value = current + (target - current) * self.smoothing
+                if abs(target - value) < EPSILON:
+                    value = target
+                if self.force or value != current:
+                    self.output[key] = value
+                    changed.append(key)
+
+            if not changed:
+                return
+
+            self.force = False
+            self.version += 1
+            messages = [[key, float(self.output[key]), self.epoch, self.version] for key in changed]
+            clients = list(self.subscribers.items())
+
+        for (ip, port), client in clients:
+            try:
+                for msg in messages:
+                    client.send_message(CONTROL_ADDRESS, msg)
+            except OSError as e:
+                print(f"Control-Update an {ip}:{port} fehlgeschlagen: {e}")
+
+    # --- OSC Handler (für dispatcher.map mit needs_reply_address=True) ---
+    def handle_sync(self, client_address, address, *args):
+        # Mit Port: Absender abonniert die laufenden Updates auf diesem Port.
+        # Ohne Port: nur einmalige Antwort an den Absender-Port, kein Abonnement.
+        ip = client_address[0]
+        if args:
+            client = self.subscribe(ip, int(args[0]))
+        else:
+            client = SimpleUDPClient(ip, client_address[1])
+        client.send_message(STATE_ADDRESS, self.snapshot())
+
+    def handle_preset(self, client_address, address, *args):
+        if not args:
+            return
+        duration = float(args[1]) if len(args) > 1 else 2.0
+        self.morph_to(str(args[0]), duration)
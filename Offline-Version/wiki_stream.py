@@ -0,0 +1,123 @@
+import json
+import time
+from collections import namedtuple
+import requests
+
+# --- Konfiguration ---
+STREAM_URL = "https://stream.wikimedia.org/v2/stream/recentchange"
+
+# Wir tarnen uns als normaler Chrome Browser, um Blockaden zu vermeiden
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Accept": "text/event-stream"
+}
+
+# Typisierter Edit-Record. Die Feldreihenfolge entspricht den OSC-Argumenten von /wiki/edit_full,
+# sodass list(event) direkt als OSC-Payload verwendet werden kann.
+EditEvent = namedtuple("EditEvent", ["delta", "is_bot", "title_len", "wiki_hash", "title", "wiki"])
+
+
+def iter_recent_changes(url=STREAM_URL, chunk_size=128, stop_event=None):
+    """Liest den SSE-Stream im Byte-Buffer-Modus und liefert jedes Event als dict.
+
+    Bei Verbindungsabbrüchen wird nach 3s automatisch neu verbunden.
+    Mit einem threading.Event als stop_event lässt sich der Reader von außen beenden.
+    """
+    print(f"Verbinde mit {url} (Byte-Buffer-Modus)...")
+
+    while stop_event is None or not stop_event.is_set():
+        try:
+            with requests.get(url, headers=HEADERS, stream=True, timeout=30) as response:
+                if response.status_code != 200:
+                    print(f"Fehler: Server antwortet mit Code {response.status_code}")
+                    time.sleep(5)
+                    continue
+
+                print("Verbunden! Lese Stream...")
+
+                # Puffer für unvollständige Zeilen
+                buffer = b""
+                event_data = ""
+
+                # iter_content mit kleiner Chunk-Size erzwingt das sofortige Lesen
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    if stop_event is not None and stop_event.is_set():
+                        return
+                    if not chunk:
+                        continue
+
+                    buffer += chunk
+
+                    # Solange wir Zeilenumbrüche im Puffer haben, verarbeiten wir sie
+                    while b'\n' in buffer:
+                        line_bytes, buffer = buffer.split(b'\n', 1)
+                        line = line_bytes.decode('utf-8', errors='replace').strip()
+
+                        if line.startswith("data:"):
+                            event_data += line[5:].strip()
+
+                        elif line == "":
+                            if not event_data:
+                                continue
+
+                            try:
+                                data = json.loads(event_data)
+                            except ValueError:
+                                data = None # Fehlerhafte Pakete ignorieren
+
+                            event_data = ""
+                            if data is not None:
+                                yield data
+
+        except Exception as e:
+            print(f"Verbindung unterbrochen: {e}. Neustart in 3s...", flush=True)
+            time.sleep(3)
+
+
+def compact_edit(data):
+    """Reduziert ein Edit-Event auf die Felder, die processData in stream.js nutzt.
+
+    Gibt None zurück, wenn es sich nicht um ein Edit handelt.
+    """
+    if data.get('type') != 'edit':
+        return None
+
+    length = data.get("length") or {}
+    return {
+        "w": data.get("wiki", "unknown"),
+        "t": data.get("title", ""),
+        "u": data.get("user", ""),
+        "b": 1 if data.get("bot", False) else 0,
+        "m": 1 if data.get("minor", False) else 0,
+        "o": length.get("old") or 0,
+        "n": length.get("new") or 0
+    }
+
+
+def to_edit_event(data):
+    """Wandelt ein Edit-Event in einen EditEvent um (wie an SuperCollider und Visualizer gesendet).
+
+    Gibt None zurück für andere Event-Typen und Edits ohne Größenänderung.
+    """
+    if data.get('type') != 'edit':
+        return None
+
+    title = data.get("title", "")
+    wiki = data.get("wiki", "unknown")
+
+    length = data.get("length") or {}
+    old = length.get("old") or 0
+    new = length.get("new") or 0
+    delta = float(new - old)
+
+    if delta == 0:
+        return None
+
+    return EditEvent(
+        delta,
+        1.0 if data.get("bot", False) else 0.0,
+        float(len(title)),
+        float(sum(ord(c) for c in wiki)),
+        title,
+        wiki
+    )
@@ -301,22 +301,18 @@ function startExperience(withTutorial) {
     render();
 
     // Stream Setup
+    // Mit ?hub (Seite vom Python-Hub ausgeliefert) oder ?hub=ws://host:8765/stream
+    // teilen sich alle Clients eine einzige Upstream-Verbindung.
+    const hubParam = new URLSearchParams(window.location.search).get('hub');
+    if (hubParam !== null) {
+        connectHub(hubParam, withTutorial);
+        return;
+    }
+
     const url = "https://stream.wikimedia.org/v2/stream/recentchange";
     const eventSource = new EventSource(url);
 
-    eventSource.onopen = () => {
-        const statusEl = document.getElementById('status');
-        if (statusEl) {
-            statusEl.innerText = "Online";
-            statusEl.style.color = "#00ff88";
-        }
-        const logEl = document.getElementById('log');
-        if(logEl) logEl.innerText = "Live stream active";
-        
-        if (withTutorial) {
-            setTimeout(() => Tutorial.start(), 500);
-        }
-    };
+    eventSource.onopen = () => setStreamOnline(withTutorial);
 
     eventSource.onmessage = (event) => {
         const data = JSON.parse(event.data);
@@ -324,15 +320,64 @@ function startExperience(withTutorial) {
         processData(data);
     };
 
-    eventSource.onerror = () => {
-        const statusEl = document.getElementById('status');
-        if (statusEl) {
-            statusEl.innerText = "Disconnected";
-            statusEl.style.color = "#ff3e3e";
-        }
+    eventSource.onerror = setStreamOffline;
+}
+
+// --- HUB CONNECTION ---
+function connectHub(hubUrl, withTutorial) {
+    const wsProtocol = window.location.protocol === 'https:' ? 'wss' : 'ws';
+    const url = hubUrl || `${wsProtocol}://${window.location.host}/stream`;
+    const socket = new WebSocket(url);
+
+    socket.onopen = () => setStreamOnline(withTutorial);
+
+    // Der Hub sendet Batches von kompakten, bereits gefilterten Edit-Records
+    socket.onmessage = (event) => {
+        const batch = JSON.parse(event.data);
+        batch.forEach(record => processData(expandRecord(record)));
+    };
+
+    // Anders als EventSource verbindet sich ein WebSocket nicht selbst neu
+    socket.onclose = () => {
+        setStreamOffline();
+        setTimeout(() => connectHub(hubUrl, false), 3000);
     };
 }
 
+function expandRecord(r) {
+    return {
+        type: 'edit',
+        wiki: r.w,
+        title: r.t,
+        user: r.u,
+        bot: r.b === 1,
+        minor: r.m === 1,
+        length: { old: r.o, new: r.n }
+    };
+}
+
+function setStreamOnline(withTutorial) {
+    const statusEl = document.getElementById('status');
+    if (statusEl) {
+        statusEl.innerText = "Online";
+        statusEl.style.color = "#00ff88";
+    }
+    const logEl = document.getElementById('log');
+    if(logEl) logEl.innerText = "Live stream active";
+
+    if (withTutorial) {
+        setTimeout(() => Tutorial.start(), 500);
+    }
+}
+
+function setStreamOffline() {
+    const statusEl = document.getElementById('status');
+    if (statusEl) {
+        statusEl.innerText = "Disconnected";
+        statusEl.style.color = "#ff3e3e";
+    }
+}
+
 function processData(data) {
     editCount++;
     const countEl = document.getElementById('count');